@@ -1,5 +1,6 @@
 """Pydantic schemas for the publishing workflow API."""
 
+import re
 from datetime import datetime
 from uuid import UUID
 
@@ -32,7 +33,7 @@ class PublishPreview(BaseModel):
 VERSION_PATTERN = r"^\d+(\.\d+)+(-pre\d+)?$"
 
 
-PRE_RELEASE_SUFFIX = r"-pre\d+$"
+PRE_RELEASE_SUFFIX = re.compile(r"-pre\d+$")
 
 
 class PublishRequest(BaseModel):
@@ -45,9 +46,7 @@ class PublishRequest(BaseModel):
 
     @model_validator(mode="after")
     def version_matches_pre_release_flag(self) -> PublishRequest:
-        import re
-
-        has_suffix = bool(re.search(PRE_RELEASE_SUFFIX, self.version))
+        has_suffix = PRE_RELEASE_SUFFIX.search(self.version) is not None
         if self.pre_release and not has_suffix:
             raise ValueError("pre-release versions must have a -preN suffix")
         if not self.pre_release and has_suffix:
@@ -173,6 +173,32 @@ class ConceptService:
         )
         return list(result.scalars().all())
 
+    async def list_concepts_for_schemes(
+        self, scheme_ids: list[UUID]
+    ) -> dict[UUID, list[Concept]]:
+        """List concepts for several schemes in one query, grouped by scheme ID.
+
+        Each scheme's concepts are ordered alphabetically by pref_label. Scheme IDs
+        are not checked; unknown IDs map to an empty list.
+        """
+        grouped: dict[UUID, list[Concept]] = {scheme_id: [] for scheme_id in scheme_ids}
+        if not scheme_ids:
+            return grouped
+
+        result = await self.db.execute(
+            select(Concept)
+            .where(Concept.scheme_id.in_(scheme_ids))
+            .options(
+                selectinload(Concept.broader),
+                selectinload(Concept._related_as_subject),
+                selectinload(Concept._related_as_object),
+            )
+            .order_by(Concept.pref_label)
+        )
+        for concept in result.scalars():
+            grouped[concept.scheme_id].append(concept)
+        return grouped
+
     async def create_concept(
         self,
         scheme_id: UUID,
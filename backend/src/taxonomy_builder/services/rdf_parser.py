@@ -297,9 +297,10 @@ def _check_unsupported_restrictions(g: Graph, result: ValidationResult) -> None:
 def get_identifier_from_uri(uri: URIRef) -> str:
     """Extract identifier (local name) from URI."""
     uri_str = str(uri)
-    if "#" in uri_str:
-        return uri_str.split("#")[-1]
-    return uri_str.rstrip("/").split("/")[-1]
+    _, hash_sep, fragment = uri_str.rpartition("#")
+    if hash_sep:
+        return fragment
+    return uri_str.rstrip("/").rpartition("/")[2]
 
 
 def is_xsd_type(uri_str: str) -> bool:
@@ -110,9 +110,14 @@ class SKOSImportService:
         self, project_id: UUID, content: bytes, filename: str
     ) -> ImportPreviewResponse:
         """Parse RDF and return preview without committing."""
-        fmt = detect_format(filename)
-        g = parse_rdf(content, fmt)
+        g = parse_rdf(content, detect_format(filename))
+        return await self.preview_graph(project_id, g)
 
+    async def preview_graph(self, project_id: UUID, g: Graph) -> ImportPreviewResponse:
+        """Return an import preview for an already-parsed graph.
+
+        The graph is only read, so callers may reuse it across calls.
+        """
         analysis = analyze_graph(g)
 
         # Load existing project data for duplicate detection and range resolution
@@ -388,9 +393,14 @@ class SKOSImportService:
         self, project_id: UUID, content: bytes, filename: str
     ) -> ImportResultResponse:
         """Parse RDF and create schemes/concepts/classes/properties in database."""
-        fmt = detect_format(filename)
-        g = parse_rdf(content, fmt)
+        g = parse_rdf(content, detect_format(filename))
+        return await self.execute_graph(project_id, g)
 
+    async def execute_graph(self, project_id: UUID, g: Graph) -> ImportResultResponse:
+        """Create schemes/concepts/classes/properties from an already-parsed graph.
+
+        The graph is only read, so callers may reuse it across calls.
+        """
         analysis = analyze_graph(g)
 
         # Load existing data once for duplicate detection and range resolution
@@ -47,9 +47,12 @@ class SnapshotService:
         """
         project = await self._project_service.get_project(project_id)
 
+        concepts_by_scheme = await self._concept_service.list_concepts_for_schemes(
+            [scheme.id for scheme in project.schemes]
+        )
         schemes = []
         for scheme in project.schemes:
-            scheme.concepts = await self._concept_service.list_concepts_for_scheme(scheme.id)
+            scheme.concepts = concepts_by_scheme[scheme.id]
             schemes.append(SnapshotScheme.from_scheme(scheme))
 
         result = await self.db.execute(
@@ -95,7 +98,7 @@ def validate_snapshot(snapshot: SnapshotVocabulary) -> ValidationResult:
             ctx = err.get("ctx", {})
             entity_id_str = ctx.get("entity_id")
             errors.append(
-                ValidationError(
+                ValidationError.model_construct(
                     code=err["type"],
                     message=err["msg"],
                     entity_type=ctx.get("entity_type"),
@@ -105,7 +108,7 @@ def validate_snapshot(snapshot: SnapshotVocabulary) -> ValidationResult:
             )
 
     errors.extend(_validate_references(snapshot))
-    return ValidationResult(valid=len(errors) == 0, errors=errors)
+    return ValidationResult.model_construct(valid=len(errors) == 0, errors=errors)
 
 
 def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
@@ -122,7 +125,7 @@ def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
             for bid in concept.broader_ids or []:
                 if bid not in all_concept_ids:
                     errors.append(
-                        ValidationError(
+                        ValidationError.model_construct(
                             code="broken_broader_ref",
                             message=(
                                 f"Concept '{concept.pref_label}' has a broader"
@@ -136,7 +139,7 @@ def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
             for rid in concept.related_ids or []:
                 if rid not in all_concept_ids:
                     errors.append(
-                        ValidationError(
+                        ValidationError.model_construct(
                             code="broken_related_ref",
                             message=(
                                 f"Concept '{concept.pref_label}' has a related"
@@ -157,7 +160,7 @@ def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
                 and superclass_uri not in WELL_KNOWN_SUPERCLASS_URIS
             ):
                 errors.append(
-                    ValidationError(
+                    ValidationError.model_construct(
                         code="broken_superclass_ref",
                         message=(
                             f"class '{cls.label}' references superclass"
@@ -173,7 +176,7 @@ def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
     for prop in snapshot.properties or []:
         if prop.range_scheme_id and prop.range_scheme_id not in scheme_ids:
             errors.append(
-                ValidationError(
+                ValidationError.model_construct(
                     code="broken_range_scheme_ref",
                     message=f"property '{prop.label}' references a non-existent scheme.",
                     entity_type="property",
@@ -184,7 +187,7 @@ def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
         for domain_uri in prop.domain_class_uris or []:
             if domain_uri not in class_uris:
                 errors.append(
-                    ValidationError(
+                    ValidationError.model_construct(
                         code="broken_domain_class_ref",
                         message=(
                             f"property '{prop.label}' references domain class"
@@ -198,7 +201,7 @@ def _validate_references(snapshot: SnapshotVocabulary) -> list[ValidationError]:
                 )
         if prop.range_class and prop.range_class not in class_uris:
             errors.append(
-                ValidationError(
+                ValidationError.model_construct(
                     code="broken_range_class_ref",
                     message=(
                         f"property '{prop.label}' references range class"
@@ -251,6 +254,9 @@ def compute_diff(
     current: SnapshotVocabulary,
 ) -> DiffResult:
     """Diff two snapshots, returning added/modified/removed items."""
+    if previous is current:
+        return DiffResult(added=[], modified=[], removed=[])
+
     # Build label lookup for resolving IDs in relationship fields
     labels: dict[UUID, str] = {}
     for snap in (previous, current):
@@ -1,10 +1,12 @@
 """Pytest fixtures for testing."""
 
+import os
 from collections.abc import AsyncGenerator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 import taxonomy_builder.blob_store as blob_store_module
 from taxonomy_builder.api.dependencies import AuthenticatedUser, get_current_user
@@ -19,10 +21,33 @@ from taxonomy_builder.models.project import Project
 from taxonomy_builder.models.user import User
 
 
+async def _recreate_database(admin_url: str, name: str, *, create: bool) -> None:
+    """Drop (and optionally re-create) a database via a connection to ``admin_url``."""
+    engine = create_async_engine(admin_url, isolation_level="AUTOCOMMIT")
+    async with engine.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+        if create:
+            await conn.execute(text(f'CREATE DATABASE "{name}"'))
+    await engine.dispose()
+
+
 @pytest.fixture(scope="session", autouse=True)
 async def _init_db() -> AsyncGenerator[None]:
-    """Initialize database manager for test session."""
-    db_manager.init(settings.test_database_url)
+    """Initialize database manager for test session.
+
+    Under pytest-xdist each worker gets its own database (suffixed with the
+    worker id) so workers don't race on create_all/drop_all.
+    """
+    database_url = settings.test_database_url
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    worker_db = None
+    if worker:
+        url = make_url(database_url)
+        worker_db = f"{url.database}_{worker}"
+        await _recreate_database(database_url, worker_db, create=True)
+        database_url = url.set(database=worker_db).render_as_string(hide_password=False)
+
+    db_manager.init(database_url)
     async with db_manager.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -30,6 +55,9 @@ async def _init_db() -> AsyncGenerator[None]:
         await conn.run_sync(Base.metadata.drop_all)
     await db_manager.close()
 
+    if worker_db:
+        await _recreate_database(settings.test_database_url, worker_db, create=False)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def _init_blob_store(tmp_path_factory: pytest.TempPathFactory) -> None:
@@ -0,0 +1,18 @@
+"""Shared helpers for tests."""
+
+import itertools
+from datetime import UTC, datetime
+from uuid import UUID
+
+# Snapshot validation and diffing only compare ids for equality, so a counter
+# is as good as uuid4() and keeps failures reproducible across runs.
+_uid_counter = itertools.count(1)
+
+
+def uid() -> UUID:
+    """Return the next id from a process-wide counter."""
+    return UUID(int=next(_uid_counter))
+
+
+# Fixed timestamp for published versions whose publish time a test never inspects.
+PUBLISHED_AT = datetime(2024, 1, 1, tzinfo=UTC)
@@ -33,13 +33,10 @@ async def publishable_project(db_session: AsyncSession, project: Project) -> Pro
         project_id=project.id,
         title="Test Scheme",
         uri="http://example.org/scheme",
+        concepts=[Concept(pref_label="Term A", identifier="term-a")],
     )
     db_session.add(scheme)
     await db_session.flush()
-    await db_session.refresh(scheme)
-
-    db_session.add(Concept(scheme_id=scheme.id, pref_label="Term A", identifier="term-a"))
-    await db_session.flush()
 
     # Expunge so the API handler loads a fresh project with relationships
     db_session.expunge(project)
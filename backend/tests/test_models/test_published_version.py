@@ -1,6 +1,5 @@
 """Tests for the PublishedVersion model."""
 
-from datetime import datetime
 from uuid import UUID
 
 import pytest
@@ -10,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from taxonomy_builder.models.project import Project
 from taxonomy_builder.models.published_version import PublishedVersion
+from tests.helpers import PUBLISHED_AT
 
 
 @pytest.fixture
@@ -43,7 +43,7 @@ async def test_create_published_version(
         notes="First published version.",
         publisher="Evidence Synthesis Institute",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot=snapshot,
     )
     db_session.add(version)
@@ -71,7 +71,7 @@ async def test_unique_version_per_project(
         project_id=project.id,
         version="1.0",
         title="First",
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add(v1)
@@ -81,7 +81,7 @@ async def test_unique_version_per_project(
         project_id=project.id,
         version="1.0",
         title="Duplicate",
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add(v2)
@@ -99,14 +99,14 @@ async def test_same_version_different_projects(
         project_id=project.id,
         version="1.0",
         title="Project 1 Release",
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     v2 = PublishedVersion(
         project_id=other_project.id,
         version="1.0",
         title="Project 2 Release",
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([v1, v2])
@@ -126,7 +126,7 @@ async def test_multiple_pre_releases_allowed(
         version="1.1-pre1",
         title="Pre-release 1",
         finalized=False,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     pre2 = PublishedVersion(
@@ -134,7 +134,7 @@ async def test_multiple_pre_releases_allowed(
         version="1.1-pre2",
         title="Pre-release 2",
         finalized=False,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([pre1, pre2])
@@ -152,7 +152,7 @@ async def test_version_lineage(db_session: AsyncSession, project: Project) -> No
         version="1.0",
         title="V1",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add(v1)
@@ -164,7 +164,7 @@ async def test_version_lineage(db_session: AsyncSession, project: Project) -> No
         version="2.0",
         title="V2",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         previous_version_id=v1.id,
         snapshot={},
     )
@@ -186,7 +186,7 @@ async def test_cascade_delete_with_project(
         project_id=project.id,
         version="1.0",
         title="Release",
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={"concept_schemes": []},
     )
     db_session.add(version)
@@ -253,7 +253,7 @@ async def test_jsonb_round_trip(db_session: AsyncSession, project: Project) -> N
         project_id=project.id,
         version="1.0",
         title="Full Snapshot",
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot=snapshot,
     )
     db_session.add(version)
@@ -277,7 +277,7 @@ async def test_version_sort_key(
         version="1.2.3",
         title="Three-part",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     v2 = PublishedVersion(
@@ -285,7 +285,7 @@ async def test_version_sort_key(
         version="2.0",
         title="Two-part",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([v3, v2])
@@ -307,7 +307,7 @@ async def test_version_sort_key_pre_release(
         version="1.0-pre1",
         title="Pre 1",
         finalized=False,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     pre2 = PublishedVersion(
@@ -315,7 +315,7 @@ async def test_version_sort_key_pre_release(
         version="1.0-pre2",
         title="Pre 2",
         finalized=False,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     release = PublishedVersion(
@@ -323,7 +323,7 @@ async def test_version_sort_key_pre_release(
         version="1.0",
         title="Release",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([pre1, pre2, release])
@@ -349,7 +349,7 @@ async def test_pre_release_sorts_before_release(
                 version=v,
                 title=f"V{v}",
                 finalized=not v.endswith(("-pre1", "-pre2")),
-                published_at=datetime.now(),
+                published_at=PUBLISHED_AT,
                 snapshot={},
             )
         )
@@ -374,7 +374,7 @@ async def test_latest_true_for_highest_finalized(
         version="1.0",
         title="V1",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     v2 = PublishedVersion(
@@ -382,7 +382,7 @@ async def test_latest_true_for_highest_finalized(
         version="2.0",
         title="V2",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([v1, v2])
@@ -410,7 +410,7 @@ async def test_latest_excludes_pre_releases(
         version="1.0",
         title="Released",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     pre_release = PublishedVersion(
@@ -418,7 +418,7 @@ async def test_latest_excludes_pre_releases(
         version="2.0-pre1",
         title="Pre-release",
         finalized=False,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([finalized, pre_release])
@@ -445,7 +445,7 @@ async def test_latest_false_when_only_pre_releases(
         version="1.0-pre1",
         title="Pre-release",
         finalized=False,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add(pre)
@@ -471,7 +471,7 @@ async def test_latest_queryable(
         version="1.0",
         title="V1",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     v2 = PublishedVersion(
@@ -479,7 +479,7 @@ async def test_latest_queryable(
         version="2.0",
         title="V2",
         finalized=True,
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
         snapshot={},
     )
     db_session.add_all([v1, v2])
@@ -508,7 +508,7 @@ async def test_latest_semver_ordering(
                 version=v,
                 title=f"V{v}",
                 finalized=True,
-                published_at=datetime.now(),
+                published_at=PUBLISHED_AT,
                 snapshot={},
             )
         )
@@ -0,0 +1,72 @@
+"""Tests for ConceptService.list_concepts_for_schemes."""
+
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taxonomy_builder.models.concept import Concept
+from taxonomy_builder.models.concept_broader import ConceptBroader
+from taxonomy_builder.models.concept_related import ConceptRelated
+from taxonomy_builder.models.concept_scheme import ConceptScheme
+from taxonomy_builder.services.concept_service import ConceptService
+
+
+async def test_groups_by_scheme_in_pref_label_order(
+    db_session: AsyncSession, scheme: ConceptScheme, scheme2: ConceptScheme
+):
+    """Each scheme maps to its own concepts, ordered by pref_label."""
+    db_session.add_all([
+        Concept(scheme_id=scheme.id, pref_label="Dogs", identifier="dogs"),
+        Concept(scheme_id=scheme.id, pref_label="Cats", identifier="cats"),
+        Concept(scheme_id=scheme2.id, pref_label="Zebras", identifier="zebras"),
+        Concept(scheme_id=scheme2.id, pref_label="Ants", identifier="ants"),
+    ])
+    await db_session.flush()
+
+    svc = ConceptService(db_session)
+    result = await svc.list_concepts_for_schemes([scheme.id, scheme2.id])
+
+    assert set(result) == {scheme.id, scheme2.id}
+    assert [c.pref_label for c in result[scheme.id]] == ["Cats", "Dogs"]
+    assert [c.pref_label for c in result[scheme2.id]] == ["Ants", "Zebras"]
+
+
+async def test_empty_scheme_ids_returns_empty_dict(db_session: AsyncSession):
+    """No scheme IDs means no query and an empty mapping."""
+    svc = ConceptService(db_session)
+    assert await svc.list_concepts_for_schemes([]) == {}
+
+
+async def test_scheme_without_concepts_maps_to_empty_list(
+    db_session: AsyncSession, concept: Concept, scheme2: ConceptScheme
+):
+    """A scheme with no concepts, or an unknown ID, still gets an entry."""
+    unknown_id = uuid4()
+    svc = ConceptService(db_session)
+    result = await svc.list_concepts_for_schemes([concept.scheme_id, scheme2.id, unknown_id])
+
+    assert [c.id for c in result[concept.scheme_id]] == [concept.id]
+    assert result[scheme2.id] == []
+    assert result[unknown_id] == []
+
+
+async def test_loads_broader_and_related(db_session: AsyncSession, concepts: list[Concept]):
+    """Broader and related concepts are loaded with the listed concepts."""
+    dogs, cats, vet_medicine = concepts
+    scheme_id = dogs.scheme_id
+    db_session.add_all([
+        ConceptBroader(concept_id=dogs.id, broader_concept_id=vet_medicine.id),
+        ConceptRelated(
+            concept_id=min(dogs.id, cats.id), related_concept_id=max(dogs.id, cats.id)
+        ),
+    ])
+    await db_session.flush()
+    db_session.expunge_all()
+
+    svc = ConceptService(db_session)
+    result = await svc.list_concepts_for_schemes([scheme_id])
+    by_label = {c.pref_label: c for c in result[scheme_id]}
+
+    assert [c.id for c in by_label["Dogs"].broader] == [vet_medicine.id]
+    assert [c.id for c in by_label["Dogs"].related] == [cats.id]
+    assert [c.id for c in by_label["Cats"].related] == [dogs.id]
@@ -10,8 +10,17 @@ from rdflib import Graph
 from rdflib.namespace import RDF, SKOS
 
 from taxonomy_builder.blob_store import FilesystemBlobStore, NoOpPurger
+from taxonomy_builder.models.concept import Concept
+from taxonomy_builder.models.concept_scheme import ConceptScheme
+from taxonomy_builder.models.project import Project
+from taxonomy_builder.schemas.publishing import PublishRequest
 from taxonomy_builder.schemas.snapshot import SnapshotVocabulary
+from taxonomy_builder.services.concept_service import ConceptService
+from taxonomy_builder.services.project_service import ProjectService
+from taxonomy_builder.services.publishing_service import PublishingService
+from taxonomy_builder.services.reader_file_service import ReaderFileService
 from taxonomy_builder.services.skos_export_service import SKOSExportService
+from taxonomy_builder.services.snapshot_service import SnapshotService
 
 # ---------------------------------------------------------------------------
 # Test helpers – same lightweight stand-ins as test_reader_file_service.py
@@ -220,41 +229,25 @@ class TestRenderRdfArtifacts:
 class TestPublishArtifacts:
     @pytest.fixture
     async def publishable(self, db_session):
-        from taxonomy_builder.models.concept import Concept
-        from taxonomy_builder.models.concept_scheme import ConceptScheme
-        from taxonomy_builder.models.project import Project
-
         project = Project(
             name="Artifact Test",
             namespace="http://example.org/artifacts",
             identifier_prefix="ART",
+            schemes=[
+                ConceptScheme(
+                    title="Terms",
+                    uri="http://example.org/artifacts/terms",
+                    concepts=[Concept(pref_label="Alpha", identifier="alpha")],
+                )
+            ],
         )
         db_session.add(project)
         await db_session.flush()
-        await db_session.refresh(project)
-
-        scheme = ConceptScheme(
-            project_id=project.id,
-            title="Terms",
-            uri="http://example.org/artifacts/terms",
-        )
-        db_session.add(scheme)
-        await db_session.flush()
-        await db_session.refresh(scheme)
-
-        db_session.add(Concept(scheme_id=scheme.id, pref_label="Alpha", identifier="alpha"))
-        await db_session.flush()
 
         db_session.expunge(project)
         return project
 
     def _make_service(self, db_session, blob_store, purger):
-        from taxonomy_builder.services.concept_service import ConceptService
-        from taxonomy_builder.services.project_service import ProjectService
-        from taxonomy_builder.services.publishing_service import PublishingService
-        from taxonomy_builder.services.reader_file_service import ReaderFileService
-        from taxonomy_builder.services.snapshot_service import SnapshotService
-
         ps = ProjectService(db_session)
         cs = ConceptService(db_session)
         ss = SnapshotService(db_session, ps, cs)
@@ -268,8 +261,6 @@ class TestPublishArtifacts:
         )
 
     async def _publish(self, service, project, version_str="1.0"):
-        from taxonomy_builder.schemas.publishing import PublishRequest
-
         request = PublishRequest(version=version_str, title=f"V{version_str}", pre_release=False)
         return await service.publish(project.id, request, publisher="Tester")
 
@@ -10,8 +10,17 @@ import jsonschema
 import pytest
 
 from taxonomy_builder.blob_store import FilesystemBlobStore, NoOpPurger
+from taxonomy_builder.models.concept import Concept
+from taxonomy_builder.models.concept_scheme import ConceptScheme
+from taxonomy_builder.models.project import Project
+from taxonomy_builder.schemas.publishing import PublishRequest
 from taxonomy_builder.schemas.snapshot import SnapshotVocabulary
+from taxonomy_builder.services.concept_service import ConceptService
+from taxonomy_builder.services.project_service import ProjectService
+from taxonomy_builder.services.publishing_service import PublishingService
 from taxonomy_builder.services.reader_file_service import ReaderFileService
+from taxonomy_builder.services.skos_export_service import SKOSExportService
+from taxonomy_builder.services.snapshot_service import SnapshotService
 
 # ---------------------------------------------------------------------------
 # JSON schema loading for validation
@@ -465,44 +474,26 @@ class TestPublishReaderFiles:
     @pytest.fixture
     async def publishable(self, db_session):
         """Create a publishable project and return (project, scheme)."""
-        from taxonomy_builder.models.concept import Concept
-        from taxonomy_builder.models.concept_scheme import ConceptScheme
-        from taxonomy_builder.models.project import Project
-
         project = Project(
             name="Reader Test",
             namespace="http://example.org/reader",
             identifier_prefix="TST",
+            schemes=[
+                ConceptScheme(
+                    title="Terms",
+                    uri="http://example.org/reader/terms",
+                    concepts=[Concept(pref_label="Alpha", identifier="alpha")],
+                )
+            ],
         )
         db_session.add(project)
         await db_session.flush()
-        await db_session.refresh(project)
-
-        scheme = ConceptScheme(
-            project_id=project.id,
-            title="Terms",
-            uri="http://example.org/reader/terms",
-        )
-        db_session.add(scheme)
-        await db_session.flush()
-        await db_session.refresh(scheme)
-
-        db_session.add(
-            Concept(scheme_id=scheme.id, pref_label="Alpha", identifier="alpha")
-        )
-        await db_session.flush()
 
         # Expunge so the publishing service loads a fresh project with relationships
         db_session.expunge(project)
         return project
 
     def _make_publishing_service(self, db_session, blob_store, cdn_purger):
-        from taxonomy_builder.services.concept_service import ConceptService
-        from taxonomy_builder.services.project_service import ProjectService
-        from taxonomy_builder.services.publishing_service import PublishingService
-        from taxonomy_builder.services.skos_export_service import SKOSExportService
-        from taxonomy_builder.services.snapshot_service import SnapshotService
-
         ps = ProjectService(db_session)
         cs = ConceptService(db_session)
         ss = SnapshotService(db_session, ps, cs)
@@ -515,8 +506,6 @@ class TestPublishReaderFiles:
 
     async def _publish(self, service, project, version_str="1.0", pre_release=False):
         """Publish a version via the service layer."""
-        from taxonomy_builder.schemas.publishing import PublishRequest
-
         request = PublishRequest(
             version=version_str, title=f"V{version_str}", pre_release=pre_release
         )
@@ -1,10 +1,10 @@
 """Tests for SKOS Export Service."""
 
-from datetime import datetime
+import json
 from uuid import uuid4
 
 import pytest
-from rdflib import Graph
+from rdflib import BNode, Graph, URIRef
 from rdflib.namespace import DCTERMS, OWL, RDF, RDFS, SKOS, XSD
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,6 +24,7 @@ from taxonomy_builder.schemas.snapshot import (
     SnapshotVocabulary,
 )
 from taxonomy_builder.services.skos_export_service import SchemeNotFoundError, SKOSExportService
+from tests.helpers import PUBLISHED_AT
 
 
 @pytest.fixture
@@ -280,8 +281,6 @@ async def test_export_jsonld_format(
     assert len(g) > 0
 
     # Should be JSON
-    import json
-
     parsed = json.loads(result)
     assert isinstance(parsed, (dict, list))
 
@@ -638,7 +637,7 @@ async def published_version(
         version="1.0",
         title="v1.0",
         snapshot=snapshot.model_dump(mode="json"),
-        published_at=datetime.now()
+        published_at=PUBLISHED_AT
     )
     db_session.add(published)
     await db_session.flush()
@@ -701,8 +700,6 @@ async def test_export_published_version_jsonld(
     published_version: PublishedVersion,
 ) -> None:
     """Test that export_published_version serializes as JSON-LD."""
-    import json
-
     result = await export_service.export_published_version(published_version, "json-ld")
 
     g = Graph()
@@ -741,7 +738,7 @@ async def test_export_published_version_multiple_schemes(
         version="2.0",
         title="v2.0",
         snapshot=snapshot.model_dump(mode="json"),
-        published_at=datetime.now()
+        published_at=PUBLISHED_AT
     )
     db_session.add(published)
     await db_session.flush()
@@ -839,11 +836,6 @@ async def test_export_class_superclass_uris(
     project: Project,
 ) -> None:
     """Test that rdfs:subClassOf triples are emitted for each superclass_uri."""
-    from datetime import datetime
-
-    from taxonomy_builder.models.published_version import PublishedVersion
-    from taxonomy_builder.schemas.snapshot import SnapshotProjectMetadata, SnapshotScheme
-
     snap = SnapshotVocabulary.model_construct(
         project=SnapshotProjectMetadata.model_construct(
             id=project.id,
@@ -891,7 +883,7 @@ async def test_export_class_superclass_uris(
         version="1.0",
         title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -901,8 +893,6 @@ async def test_export_class_superclass_uris(
     g = Graph()
     g.parse(data=result, format="turtle")
 
-    from rdflib import URIRef
-
     subclass_triples = list(
         g.triples((URIRef("http://example.org/QuantitativeFinding"), RDFS.subClassOf, None))
     )
@@ -1045,8 +1035,6 @@ async def test_export_single_domain_plain_triple(
     project: Project,
 ) -> None:
     """Single-domain property emits plain rdfs:domain <URI> triple."""
-    from rdflib import URIRef
-
     snap = _make_published_snapshot(project, [
         SnapshotProperty.model_construct(
             id=uuid4(),
@@ -1062,7 +1050,7 @@ async def test_export_single_domain_plain_triple(
     pv = PublishedVersion(
         project_id=project.id, version="1.0", title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -1085,8 +1073,6 @@ async def test_export_multi_domain_union(
     project: Project,
 ) -> None:
     """Multi-domain property emits owl:unionOf RDF Collection."""
-    from rdflib import BNode, URIRef
-
     snap = _make_published_snapshot(project, [
         SnapshotProperty.model_construct(
             id=uuid4(),
@@ -1106,7 +1092,7 @@ async def test_export_multi_domain_union(
     pv = PublishedVersion(
         project_id=project.id, version="1.0", title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -1148,8 +1134,6 @@ async def test_export_range_class_emits_triple(
     project: Project,
 ) -> None:
     """Property with range_class emits rdfs:range and owl:ObjectProperty."""
-    from rdflib import URIRef
-
     snap = _make_published_snapshot(project, [
         SnapshotProperty.model_construct(
             id=uuid4(),
@@ -1165,7 +1149,7 @@ async def test_export_range_class_emits_triple(
     pv = PublishedVersion(
         project_id=project.id, version="1.0", title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -1188,8 +1172,6 @@ async def test_export_rdf_property_with_range(
     project: Project,
 ) -> None:
     """rdf:Property with rdfs:range exports as rdf:Property, not DatatypeProperty."""
-    from rdflib import URIRef
-
     snap = _make_published_snapshot(project, [
         SnapshotProperty.model_construct(
             id=uuid4(),
@@ -1206,7 +1188,7 @@ async def test_export_rdf_property_with_range(
     pv = PublishedVersion(
         project_id=project.id, version="1.0", title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -1233,8 +1215,6 @@ async def test_export_restriction_blank_nodes(
     project: Project,
 ) -> None:
     """Restrictions should produce rdfs:subClassOf blank node with owl:Restriction."""
-    from rdflib import BNode, URIRef
-
     snap = _make_published_snapshot(
         project,
         properties=[],
@@ -1264,7 +1244,7 @@ async def test_export_restriction_blank_nodes(
     pv = PublishedVersion(
         project_id=project.id, version="1.0", title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -1296,8 +1276,6 @@ async def test_export_concept_dual_typing(
     project: Project,
 ) -> None:
     """Concepts with concept_type_uris should get additional rdf:type triples."""
-    from rdflib import URIRef
-
     concept_id = uuid4()
     snap = SnapshotVocabulary.model_construct(
         project=SnapshotProjectMetadata.model_construct(
@@ -1330,7 +1308,7 @@ async def test_export_concept_dual_typing(
     pv = PublishedVersion(
         project_id=project.id, version="1.0", title="v1.0",
         snapshot=snap.model_dump(mode="json"),
-        published_at=datetime.now(),
+        published_at=PUBLISHED_AT,
     )
     db_session.add(pv)
     await db_session.flush()
@@ -1,6 +1,11 @@
 """Tests for the DiffService."""
 
-from uuid import uuid4
+from collections.abc import Callable
+from types import MappingProxyType
+from typing import NamedTuple
+from uuid import UUID
+
+import pytest
 
 from taxonomy_builder.schemas.snapshot import (
     DiffResult,
@@ -9,58 +14,78 @@ from taxonomy_builder.schemas.snapshot import (
     SnapshotProjectMetadata,
     SnapshotProperty,
     SnapshotScheme,
-    SnapshotVocabulary,
 )
 from taxonomy_builder.services.snapshot_service import compute_diff
+from tests.helpers import uid
+
+# compute_diff never inspects project metadata, so one instance serves every vocab.
+_PROJECT_META = SnapshotProjectMetadata.model_construct(
+    id=uid(), name="Test", namespace="http://example.org/"
+)
+
+# Scalar defaults merged into each helper's kwargs; list fields are built fresh
+# per call so no two entities share one.
+_SCHEME_DEFAULTS = MappingProxyType({"uri": "http://example.org/scheme"})
+_PROPERTY_DEFAULTS = MappingProxyType(
+    {"identifier": "prop", "cardinality": "1", "required": False}
+)
 
 
 def _project_meta() -> SnapshotProjectMetadata:
-    return SnapshotProjectMetadata.model_construct(id=uuid4(), name="Test", namespace="http://example.org/")
+    return _PROJECT_META
+
+
+class _VocabStub(NamedTuple):
+    """Duck-typed stand-in for SnapshotVocabulary.
+
+    compute_diff only reads these attributes. These tests rely on it staying
+    duck-typed; if it starts needing the real model, build SnapshotVocabulary
+    here instead.
+    """
+
+    project: SnapshotProjectMetadata
+    concept_schemes: list[SnapshotScheme]
+    properties: list[SnapshotProperty]
+    classes: list[SnapshotClass]
 
 
 def _vocab(
     *schemes: SnapshotScheme,
     properties: list[SnapshotProperty] | None = None,
     classes: list[SnapshotClass] | None = None,
-) -> SnapshotVocabulary:
-    return SnapshotVocabulary.model_construct(
-        project=_project_meta(),
-        concept_schemes=list(schemes),
-        properties=properties or [],
-        classes=classes or [],
+) -> _VocabStub:
+    return _VocabStub(
+        _project_meta(), list(schemes), properties or [], classes or []
     )
 
 
 def _scheme(title: str = "S", **kwargs) -> SnapshotScheme:
-    defaults = {"uri": "http://example.org/scheme", "concepts": []}
-    defaults.update(kwargs)
+    defaults = {**_SCHEME_DEFAULTS, "concepts": [], **kwargs}
     return SnapshotScheme.model_construct(
-        id=defaults.pop("id", uuid4()), title=title, **defaults
+        id=defaults.pop("id", uid()), title=title, **defaults
     )
 
 
 def _concept(label: str, **kwargs) -> SnapshotConcept:
     return SnapshotConcept.model_construct(
-        id=kwargs.pop("id", uuid4()), pref_label=label, **kwargs
+        id=kwargs.pop("id", uid()), pref_label=label, **kwargs
     )
 
 
 def _property(label: str, **kwargs) -> SnapshotProperty:
     defaults = {
-        "identifier": "prop",
+        **_PROPERTY_DEFAULTS,
         "domain_class_uris": ["http://example.org/SomeClass"],
-        "cardinality": "1",
-        "required": False,
+        **kwargs,
     }
-    defaults.update(kwargs)
     return SnapshotProperty.model_construct(
-        id=defaults.pop("id", uuid4()), label=label, **defaults
+        id=defaults.pop("id", uid()), label=label, **defaults
     )
 
 
 def _class(label: str, uri: str, **kwargs) -> SnapshotClass:
     return SnapshotClass.model_construct(
-        id=kwargs.pop("id", uuid4()), uri=uri, label=label, **kwargs
+        id=kwargs.pop("id", uid()), uri=uri, label=label, **kwargs
     )
 
 
@@ -72,134 +97,185 @@ class TestNoDiff:
         curr = _vocab()
         result = compute_diff(prev, curr)
         assert isinstance(result, DiffResult)
-        assert result.added == []
-        assert result.modified == []
-        assert result.removed == []
+        assert not result.added
+        assert not result.modified
+        assert not result.removed
 
     def test_identical_content(self) -> None:
-        scheme_id = uuid4()
-        concept_id = uuid4()
+        scheme_id = uid()
+        concept_id = uid()
         concept = _concept("Term A", id=concept_id, definition="Def")
         scheme = _scheme("Scheme", id=scheme_id, concepts=[concept])
         result = compute_diff(_vocab(scheme), _vocab(scheme))
-        assert result.added == []
-        assert result.modified == []
-        assert result.removed == []
+        assert not result.added
+        assert not result.modified
+        assert not result.removed
+
+    def test_same_snapshot_instance(self) -> None:
+        concept = _concept("Term A", definition="Def")
+        vocab = _vocab(_scheme("Scheme", concepts=[concept]))
+        result = compute_diff(vocab, vocab)
+        assert not result.added
+        assert not result.modified
+        assert not result.removed
+
+
+def _added_scheme() -> tuple[_VocabStub, _VocabStub]:
+    return _vocab(), _vocab(_scheme("New Scheme"))
+
+
+def _added_concept() -> tuple[_VocabStub, _VocabStub]:
+    scheme_id = uid()
+    existing = _concept("Old", id=uid())
+    added = _concept("New", id=uid())
+    return (
+        _vocab(_scheme("S", id=scheme_id, concepts=[existing])),
+        _vocab(_scheme("S", id=scheme_id, concepts=[existing, added])),
+    )
 
 
-class TestAddedEntities:
-    def test_added_scheme(self) -> None:
-        prev = _vocab()
-        new_scheme = _scheme("New Scheme")
-        curr = _vocab(new_scheme)
-        result = compute_diff(prev, curr)
-        assert len(result.added) == 1
-        assert result.added[0].label == "New Scheme"
-        assert result.added[0].entity_type == "scheme"
-
-    def test_added_concept(self) -> None:
-        scheme_id = uuid4()
-        existing = _concept("Old", id=uuid4())
-        added = _concept("New", id=uuid4())
-        prev = _vocab(_scheme("S", id=scheme_id, concepts=[existing]))
-        curr = _vocab(_scheme("S", id=scheme_id, concepts=[existing, added]))
-        result = compute_diff(prev, curr)
-        assert len(result.added) == 1
-        assert result.added[0].label == "New"
-        assert result.added[0].entity_type == "concept"
-
-    def test_added_concept_in_new_scheme(self) -> None:
-        """A concept in a newly added scheme counts as added."""
-        concept = _concept("Fresh")
-        new_scheme = _scheme("Brand New", concepts=[concept])
-        result = compute_diff(_vocab(), _vocab(new_scheme))
-        labels = {item.label for item in result.added}
-        assert "Brand New" in labels
-        assert "Fresh" in labels
+def _added_concept_in_new_scheme() -> tuple[_VocabStub, _VocabStub]:
+    """A concept in a newly added scheme counts as added."""
+    return _vocab(), _vocab(_scheme("Brand New", concepts=[_concept("Fresh")]))
 
 
-class TestRemovedEntities:
-    def test_removed_scheme(self) -> None:
-        old_scheme = _scheme("Gone")
-        result = compute_diff(_vocab(old_scheme), _vocab())
-        assert len(result.removed) == 1
-        assert result.removed[0].label == "Gone"
-        assert result.removed[0].entity_type == "scheme"
-
-    def test_removed_concept(self) -> None:
-        scheme_id = uuid4()
-        kept = _concept("Kept", id=uuid4())
-        gone = _concept("Gone", id=uuid4())
-        prev = _vocab(_scheme("S", id=scheme_id, concepts=[kept, gone]))
-        curr = _vocab(_scheme("S", id=scheme_id, concepts=[kept]))
-        result = compute_diff(prev, curr)
-        assert len(result.removed) == 1
-        assert result.removed[0].label == "Gone"
-
-    def test_removed_concept_in_removed_scheme(self) -> None:
-        """Concepts in a removed scheme count as removed."""
-        concept = _concept("Orphan")
-        old_scheme = _scheme("Deleted", concepts=[concept])
-        result = compute_diff(_vocab(old_scheme), _vocab())
-        labels = {item.label for item in result.removed}
-        assert "Deleted" in labels
-        assert "Orphan" in labels
-
-
-class TestModifiedEntities:
-    def test_modified_concept_label(self) -> None:
-        scheme_id = uuid4()
-        cid = uuid4()
-        prev = _vocab(_scheme("S", id=scheme_id, concepts=[_concept("Old Label", id=cid)]))
-        curr = _vocab(_scheme("S", id=scheme_id, concepts=[_concept("New Label", id=cid)]))
-        result = compute_diff(prev, curr)
-        assert len(result.modified) == 1
-        assert result.modified[0].id == cid
-        changes = {c.field: c for c in result.modified[0].changes}
-        assert "pref_label" in changes
-        assert changes["pref_label"].old == "Old Label"
-        assert changes["pref_label"].new == "New Label"
+def _removed_scheme() -> tuple[_VocabStub, _VocabStub]:
+    return _vocab(_scheme("Gone")), _vocab()
 
-    def test_modified_concept_definition(self) -> None:
-        scheme_id = uuid4()
-        cid = uuid4()
-        prev = _vocab(
-            _scheme("S", id=scheme_id, concepts=[_concept("T", id=cid, definition="old")])
-        )
-        curr = _vocab(
-            _scheme("S", id=scheme_id, concepts=[_concept("T", id=cid, definition="new")])
-        )
-        result = compute_diff(prev, curr)
-        assert len(result.modified) == 1
-        changes = {c.field: c for c in result.modified[0].changes}
-        assert "definition" in changes
-
-    def test_modified_scheme_title(self) -> None:
-        sid = uuid4()
-        cid = uuid4()
-        concept = _concept("C", id=cid)
-        prev = _vocab(_scheme("Old Title", id=sid, concepts=[concept]))
-        curr = _vocab(_scheme("New Title", id=sid, concepts=[concept]))
-        result = compute_diff(prev, curr)
-        assert len(result.modified) == 1
-        assert result.modified[0].entity_type == "scheme"
-        changes = {c.field: c for c in result.modified[0].changes}
-        assert "title" in changes
-
-    def test_unchanged_entity_not_in_modified(self) -> None:
-        scheme_id = uuid4()
-        cid = uuid4()
-        concept = _concept("Same", id=cid, definition="same")
-        prev = _vocab(_scheme("S", id=scheme_id, concepts=[concept]))
-        curr = _vocab(_scheme("S", id=scheme_id, concepts=[concept]))
-        result = compute_diff(prev, curr)
-        assert result.modified == []
+
+def _removed_concept() -> tuple[_VocabStub, _VocabStub]:
+    scheme_id = uid()
+    kept = _concept("Kept", id=uid())
+    gone = _concept("Gone", id=uid())
+    return (
+        _vocab(_scheme("S", id=scheme_id, concepts=[kept, gone])),
+        _vocab(_scheme("S", id=scheme_id, concepts=[kept])),
+    )
+
+
+def _removed_concept_in_removed_scheme() -> tuple[_VocabStub, _VocabStub]:
+    """Concepts in a removed scheme count as removed."""
+    return _vocab(_scheme("Deleted", concepts=[_concept("Orphan")])), _vocab()
+
+
+# Ids of the entities the modified cases change, so the expectations can name them.
+_MODIFIED_CONCEPT_ID = uid()
+_MODIFIED_SCHEME_ID = uid()
+
+
+def _modified_concept_label() -> tuple[_VocabStub, _VocabStub]:
+    scheme_id = uid()
+    cid = _MODIFIED_CONCEPT_ID
+    return (
+        _vocab(_scheme("S", id=scheme_id, concepts=[_concept("Old Label", id=cid)])),
+        _vocab(_scheme("S", id=scheme_id, concepts=[_concept("New Label", id=cid)])),
+    )
+
+
+def _modified_concept_definition() -> tuple[_VocabStub, _VocabStub]:
+    scheme_id = uid()
+    cid = _MODIFIED_CONCEPT_ID
+    return (
+        _vocab(_scheme("S", id=scheme_id, concepts=[_concept("T", id=cid, definition="old")])),
+        _vocab(_scheme("S", id=scheme_id, concepts=[_concept("T", id=cid, definition="new")])),
+    )
+
+
+def _modified_scheme_title() -> tuple[_VocabStub, _VocabStub]:
+    sid = _MODIFIED_SCHEME_ID
+    concept = _concept("C", id=uid())
+    return (
+        _vocab(_scheme("Old Title", id=sid, concepts=[concept])),
+        _vocab(_scheme("New Title", id=sid, concepts=[concept])),
+    )
+
+
+def _unchanged_entity() -> tuple[_VocabStub, _VocabStub]:
+    scheme_id = uid()
+    concept = _concept("Same", id=uid(), definition="same")
+    return (
+        _vocab(_scheme("S", id=scheme_id, concepts=[concept])),
+        _vocab(_scheme("S", id=scheme_id, concepts=[concept])),
+    )
+
+
+@pytest.mark.parametrize(
+    ("build", "expected_added", "expected_removed", "expected_modified"),
+    [
+        pytest.param(
+            _added_scheme, {("scheme", "New Scheme")}, set(), {}, id="added_scheme"
+        ),
+        pytest.param(_added_concept, {("concept", "New")}, set(), {}, id="added_concept"),
+        pytest.param(
+            _added_concept_in_new_scheme,
+            {("scheme", "Brand New"), ("concept", "Fresh")},
+            set(),
+            {},
+            id="added_concept_in_new_scheme",
+        ),
+        pytest.param(_removed_scheme, set(), {("scheme", "Gone")}, {}, id="removed_scheme"),
+        pytest.param(
+            _removed_concept, set(), {("concept", "Gone")}, {}, id="removed_concept"
+        ),
+        pytest.param(
+            _removed_concept_in_removed_scheme,
+            set(),
+            {("scheme", "Deleted"), ("concept", "Orphan")},
+            {},
+            id="removed_concept_in_removed_scheme",
+        ),
+        pytest.param(
+            _modified_concept_label,
+            set(),
+            set(),
+            {
+                ("concept", _MODIFIED_CONCEPT_ID, "New Label"): {
+                    "pref_label": ("Old Label", "New Label")
+                }
+            },
+            id="modified_concept_label",
+        ),
+        pytest.param(
+            _modified_concept_definition,
+            set(),
+            set(),
+            {("concept", _MODIFIED_CONCEPT_ID, "T"): {"definition": ("old", "new")}},
+            id="modified_concept_definition",
+        ),
+        pytest.param(
+            _modified_scheme_title,
+            set(),
+            set(),
+            {("scheme", _MODIFIED_SCHEME_ID, "New Title"): {"title": ("Old Title", "New Title")}},
+            id="modified_scheme_title",
+        ),
+        pytest.param(_unchanged_entity, set(), set(), {}, id="unchanged_entity_not_in_modified"),
+    ],
+)
+def test_diff_case(
+    build: Callable[[], tuple[_VocabStub, _VocabStub]],
+    expected_added: set[tuple[str, str]],
+    expected_removed: set[tuple[str, str]],
+    expected_modified: dict[tuple[str, UUID, str], dict[str, tuple[str, str]]],
+) -> None:
+    """Added, removed and modified entities between two snapshots."""
+    prev, curr = build()
+    result = compute_diff(prev, curr)
+
+    assert len(result.added) == len(expected_added)
+    assert {(item.entity_type, item.label) for item in result.added} == expected_added
+    assert len(result.removed) == len(expected_removed)
+    assert {(item.entity_type, item.label) for item in result.removed} == expected_removed
+    assert {
+        (item.entity_type, item.id, item.label): {c.field: (c.old, c.new) for c in item.changes}
+        for item in result.modified
+    } == expected_modified
 
 
 class TestConceptMovedBetweenSchemes:
     def test_moved_concept_shows_as_removed_and_added(self) -> None:
         """A concept moving between schemes appears as removed + added."""
-        sid_a, sid_b, cid = uuid4(), uuid4(), uuid4()
+        sid_a, sid_b, cid = uid(), uid(), uid()
         prev = _vocab(
             _scheme("A", id=sid_a, concepts=[_concept("Mover", id=cid)]),
             _scheme("B", id=sid_b),
@@ -213,7 +289,7 @@ class TestConceptMovedBetweenSchemes:
         assert result.removed[0].id == cid
         assert len(result.added) == 1
         assert result.added[0].id == cid
-        assert result.modified == []
+        assert not result.modified
 
 
 class TestFirstPublish:
@@ -224,14 +300,14 @@ class TestFirstPublish:
         scheme = _scheme("Initial", concepts=[concept])
         result = compute_diff(None, _vocab(scheme))
         assert len(result.added) == 2  # scheme + concept
-        assert result.modified == []
-        assert result.removed == []
+        assert not result.modified
+        assert not result.removed
 
     def test_first_publish_empty_project(self) -> None:
         result = compute_diff(None, _vocab())
-        assert result.added == []
-        assert result.modified == []
-        assert result.removed == []
+        assert not result.added
+        assert not result.modified
+        assert not result.removed
 
     def test_first_publish_includes_properties(self) -> None:
         prop = _property("Color")
@@ -248,7 +324,7 @@ class TestFirstPublish:
 
 class TestPropertyDiff:
     def test_added_property(self) -> None:
-        prop = _property("Color", id=uuid4())
+        prop = _property("Color", id=uid())
         prev = _vocab()
         curr = _vocab(properties=[prop])
         result = compute_diff(prev, curr)
@@ -257,7 +333,7 @@ class TestPropertyDiff:
         assert result.added[0].entity_type == "property"
 
     def test_removed_property(self) -> None:
-        prop = _property("Color", id=uuid4())
+        prop = _property("Color", id=uid())
         prev = _vocab(properties=[prop])
         curr = _vocab()
         result = compute_diff(prev, curr)
@@ -266,7 +342,7 @@ class TestPropertyDiff:
         assert result.removed[0].entity_type == "property"
 
     def test_modified_property(self) -> None:
-        pid = uuid4()
+        pid = uid()
         prev = _vocab(properties=[_property("Color", id=pid, description="old")])
         curr = _vocab(properties=[_property("Color", id=pid, description="new")])
         result = compute_diff(prev, curr)
@@ -276,12 +352,12 @@ class TestPropertyDiff:
         assert "description" in changes
 
     def test_unchanged_property(self) -> None:
-        pid = uuid4()
+        pid = uid()
         prop = _property("Color", id=pid, description="same")
         result = compute_diff(
             _vocab(properties=[prop]), _vocab(properties=[prop])
         )
-        assert result.modified == []
+        assert not result.modified
 
 
 class TestClassDiff:
@@ -307,7 +383,7 @@ class TestClassDiff:
 
     def test_modified_class_label(self) -> None:
         """Classes with same ID but different label appear in modified."""
-        cid = uuid4()
+        cid = uid()
         prev = _vocab(classes=[_class("Old Name", "http://example.org/Doc", id=cid)])
         curr = _vocab(classes=[_class("New Name", "http://example.org/Doc", id=cid)])
         result = compute_diff(prev, curr)
@@ -321,10 +397,10 @@ class TestClassDiff:
 
     def test_unchanged_class_not_in_modified(self) -> None:
         """Identical classes are not in modified."""
-        cid = uuid4()
+        cid = uid()
         cls = _class("Same", "http://example.org/Doc", id=cid)
         result = compute_diff(_vocab(classes=[cls]), _vocab(classes=[cls]))
-        assert result.modified == []
+        assert not result.modified
 
 
 class TestRelationshipLabelResolution:
@@ -332,10 +408,10 @@ class TestRelationshipLabelResolution:
 
     def test_broader_change_shows_labels(self) -> None:
         """broader_ids diff should resolve to pref_labels."""
-        scheme_id = uuid4()
-        parent_a = _concept("Animal", id=uuid4(), uri="http://ex.org/animal")
-        parent_b = _concept("Plant", id=uuid4(), uri="http://ex.org/plant")
-        child_id = uuid4()
+        scheme_id = uid()
+        parent_a = _concept("Animal", id=uid(), uri="http://ex.org/animal")
+        parent_b = _concept("Plant", id=uid(), uri="http://ex.org/plant")
+        child_id = uid()
 
         prev_child = _concept(
             "Dog", id=child_id, uri="http://ex.org/dog", broader_ids=[parent_a.id]
@@ -357,11 +433,11 @@ class TestRelationshipLabelResolution:
 
     def test_broader_change_multiple_labels_sorted(self) -> None:
         """Multiple broader labels should be sorted and comma-separated."""
-        scheme_id = uuid4()
-        a = _concept("Alpha", id=uuid4(), uri="http://ex.org/a")
-        b = _concept("Beta", id=uuid4(), uri="http://ex.org/b")
-        c = _concept("Gamma", id=uuid4(), uri="http://ex.org/c")
-        child_id = uuid4()
+        scheme_id = uid()
+        a = _concept("Alpha", id=uid(), uri="http://ex.org/a")
+        b = _concept("Beta", id=uid(), uri="http://ex.org/b")
+        c = _concept("Gamma", id=uid(), uri="http://ex.org/c")
+        child_id = uid()
 
         prev_child = _concept(
             "X", id=child_id, uri="http://ex.org/x", broader_ids=[b.id, a.id]
@@ -380,10 +456,10 @@ class TestRelationshipLabelResolution:
 
     def test_related_change_shows_labels(self) -> None:
         """related_ids diff should resolve to pref_labels."""
-        scheme_id = uuid4()
-        rel_a = _concept("Color", id=uuid4(), uri="http://ex.org/color")
-        rel_b = _concept("Shape", id=uuid4(), uri="http://ex.org/shape")
-        concept_id = uuid4()
+        scheme_id = uid()
+        rel_a = _concept("Color", id=uid(), uri="http://ex.org/color")
+        rel_b = _concept("Shape", id=uid(), uri="http://ex.org/shape")
+        concept_id = uid()
 
         prev_concept = _concept(
             "Thing", id=concept_id, uri="http://ex.org/thing", related_ids=[rel_a.id]
@@ -404,9 +480,9 @@ class TestRelationshipLabelResolution:
 
     def test_range_scheme_change_shows_title_and_uri(self) -> None:
         """range_scheme_id diff should show both scheme title and URI."""
-        scheme_a = _scheme("Materials", id=uuid4(), uri="http://ex.org/materials")
-        scheme_b = _scheme("Colors", id=uuid4(), uri="http://ex.org/colors")
-        pid = uuid4()
+        scheme_a = _scheme("Materials", id=uid(), uri="http://ex.org/materials")
+        scheme_b = _scheme("Colors", id=uid(), uri="http://ex.org/colors")
+        pid = uid()
 
         prev_prop = _property(
             "hasMaterial", id=pid, uri="http://ex.org/hasMaterial",
@@ -433,9 +509,9 @@ class TestRelationshipLabelResolution:
 
     def test_broader_removed_entirely(self) -> None:
         """Going from some broader concepts to none."""
-        scheme_id = uuid4()
-        parent = _concept("Animal", id=uuid4(), uri="http://ex.org/animal")
-        child_id = uuid4()
+        scheme_id = uid()
+        parent = _concept("Animal", id=uid(), uri="http://ex.org/animal")
+        child_id = uid()
 
         prev_child = _concept(
             "Dog", id=child_id, uri="http://ex.org/dog", broader_ids=[parent.id]
@@ -13,6 +13,7 @@ from taxonomy_builder.models.concept_scheme import ConceptScheme
 from taxonomy_builder.models.ontology_class import OntologyClass
 from taxonomy_builder.models.project import Project
 from taxonomy_builder.models.property import Property
+from taxonomy_builder.models.property_domain_class import PropertyDomainClass
 from taxonomy_builder.schemas.snapshot import SnapshotVocabulary
 from taxonomy_builder.services.concept_service import ConceptService
 from taxonomy_builder.services.project_service import ProjectNotFoundError, ProjectService
@@ -29,7 +30,6 @@ async def project(db_session: AsyncSession) -> Project:
     )
     db_session.add(project)
     await db_session.flush()
-    await db_session.refresh(project)
     return project
 
 
@@ -44,7 +44,6 @@ async def scheme(db_session: AsyncSession, project: Project) -> ConceptScheme:
     )
     db_session.add(scheme)
     await db_session.flush()
-    await db_session.refresh(scheme)
     return scheme
 
 
@@ -80,7 +79,6 @@ async def test_project_metadata(db_session: AsyncSession) -> None:
     )
     db_session.add(project)
     await db_session.flush()
-    await db_session.refresh(project)
 
     snapshot = await service(db_session).build_snapshot(project.id)
 
@@ -138,7 +136,6 @@ async def test_scheme_with_concepts(
     )
     db_session.add(concept)
     await db_session.flush()
-    await db_session.refresh(concept)
 
     snapshot = await service(db_session).build_snapshot(project.id)
 
@@ -181,8 +178,6 @@ async def test_broader_relationships(
     child = Concept(scheme_id=scheme.id, pref_label="Child", identifier="child")
     db_session.add_all([parent, child])
     await db_session.flush()
-    await db_session.refresh(parent)
-    await db_session.refresh(child)
 
     rel = ConceptBroader(concept_id=child.id, broader_concept_id=parent.id)
     db_session.add(rel)
@@ -204,8 +199,6 @@ async def test_related_relationships(
     concept_b = Concept(scheme_id=scheme.id, pref_label="Concept B", identifier="concept-b")
     db_session.add_all([concept_a, concept_b])
     await db_session.flush()
-    await db_session.refresh(concept_a)
-    await db_session.refresh(concept_b)
 
     # Store with smaller UUID first (per ConceptRelated convention)
     id1, id2 = sorted([concept_a.id, concept_b.id])
@@ -227,19 +220,14 @@ async def test_properties(db_session: AsyncSession, project: Project) -> None:
     scheme = ConceptScheme(
         project_id=project.id, title="Range Scheme", uri="http://example.org/range"
     )
-    db_session.add(scheme)
-    await db_session.flush()
-    await db_session.refresh(scheme)
-
     ont_cls = OntologyClass(
         project_id=project.id,
         identifier="Finding",
         label="Finding",
         uri="http://example.org/vocab/Finding",
     )
-    db_session.add(ont_cls)
+    db_session.add_all([scheme, ont_cls])
     await db_session.flush()
-    await db_session.refresh(ont_cls)
 
     prop = Property(
         project_id=project.id,
@@ -254,7 +242,6 @@ async def test_properties(db_session: AsyncSession, project: Project) -> None:
     prop.domain_classes = [ont_cls]
     db_session.add(prop)
     await db_session.flush()
-    await db_session.refresh(prop)
 
     snapshot = await service(db_session).build_snapshot(project.id)
 
@@ -292,8 +279,6 @@ async def test_classes_from_project(db_session: AsyncSession, project: Project)
     )
     db_session.add_all([cls1, cls2])
     await db_session.flush()
-    await db_session.refresh(cls1)
-    await db_session.refresh(cls2)
 
     snapshot = await service(db_session).build_snapshot(project.id)
 
@@ -325,7 +310,7 @@ async def test_round_trip(
 @pytest.mark.asyncio
 async def test_full_integration(db_session: AsyncSession, project: Project) -> None:
     """Test a complete snapshot with multiple schemes, concepts, relationships, and properties."""
-    # Create two schemes
+    # Create two schemes and an ontology class
     scheme1 = ConceptScheme(
         project_id=project.id,
         title="Scheme One",
@@ -336,28 +321,6 @@ async def test_full_integration(db_session: AsyncSession, project: Project) -> N
         title="Scheme Two",
         uri="http://example.org/scheme2",
     )
-    db_session.add_all([scheme1, scheme2])
-    await db_session.flush()
-    await db_session.refresh(scheme1)
-    await db_session.refresh(scheme2)
-
-    # Create concepts with hierarchy in scheme1
-    parent = Concept(scheme_id=scheme1.id, identifier="parent", pref_label="Parent Concept")
-    child = Concept(scheme_id=scheme1.id, identifier="child", pref_label="Child Concept")
-    db_session.add_all([parent, child])
-    await db_session.flush()
-    await db_session.refresh(parent)
-    await db_session.refresh(child)
-
-    broader_rel = ConceptBroader(concept_id=child.id, broader_concept_id=parent.id)
-    db_session.add(broader_rel)
-
-    # Create concept in scheme2
-    standalone = Concept(scheme_id=scheme2.id, identifier="standalone", pref_label="Standalone")
-    db_session.add(standalone)
-    await db_session.flush()
-
-    # Create ontology class
     ont_cls = OntologyClass(
         project_id=project.id,
         identifier="Finding",
@@ -365,11 +328,13 @@ async def test_full_integration(db_session: AsyncSession, project: Project) -> N
         description="A finding",
         uri="http://example.org/vocab/Finding",
     )
-    db_session.add(ont_cls)
+    db_session.add_all([scheme1, scheme2, ont_cls])
     await db_session.flush()
-    await db_session.refresh(ont_cls)
 
-    # Create property
+    # Concepts with hierarchy in scheme1, a standalone concept in scheme2, and a property
+    parent = Concept(scheme_id=scheme1.id, identifier="parent", pref_label="Parent Concept")
+    child = Concept(scheme_id=scheme1.id, identifier="child", pref_label="Child Concept")
+    standalone = Concept(scheme_id=scheme2.id, identifier="standalone", pref_label="Standalone")
     prop = Property(
         project_id=project.id,
         identifier="topic",
@@ -380,7 +345,10 @@ async def test_full_integration(db_session: AsyncSession, project: Project) -> N
         uri="http://example.org/vocab/topic",
     )
     prop.domain_classes = [ont_cls]
-    db_session.add(prop)
+    db_session.add_all([parent, child, standalone, prop])
+    await db_session.flush()
+
+    db_session.add(ConceptBroader(concept_id=child.id, broader_concept_id=parent.id))
     await db_session.flush()
 
     snapshot = await service(db_session).build_snapshot(project.id)
@@ -433,8 +401,6 @@ async def test_snapshot_class_superclass_uris(
     )
     db_session.add_all([parent, child])
     await db_session.flush()
-    await db_session.refresh(parent)
-    await db_session.refresh(child)
 
     db_session.add(ClassSuperclass(class_id=child.id, superclass_id=parent.id))
     await db_session.flush()
@@ -456,8 +422,6 @@ async def test_snapshot_property_domain_class_uris_from_join_table(
     db_session: AsyncSession, project: Project
 ) -> None:
     """from_property uses domain_classes relationship (sorted) over scalar."""
-    from taxonomy_builder.models.property_domain_class import PropertyDomainClass
-
     cls_a = OntologyClass(
         project_id=project.id, identifier="Study",
         label="Study", uri="http://example.org/vocab/Study",
@@ -466,11 +430,6 @@ async def test_snapshot_property_domain_class_uris_from_join_table(
         project_id=project.id, identifier="Finding",
         label="Finding", uri="http://example.org/vocab/Finding",
     )
-    db_session.add_all([cls_a, cls_b])
-    await db_session.flush()
-    await db_session.refresh(cls_a)
-    await db_session.refresh(cls_b)
-
     prop = Property(
         project_id=project.id,
         identifier="title",
@@ -480,9 +439,8 @@ async def test_snapshot_property_domain_class_uris_from_join_table(
         required=False,
         uri="http://example.org/vocab/title",
     )
-    db_session.add(prop)
+    db_session.add_all([cls_a, cls_b, prop])
     await db_session.flush()
-    await db_session.refresh(prop)
 
     # Add join rows for both classes
     db_session.add(PropertyDomainClass(
@@ -492,7 +450,6 @@ async def test_snapshot_property_domain_class_uris_from_join_table(
         property_id=prop.id, class_id=cls_a.id,
     ))
     await db_session.flush()
-    await db_session.refresh(prop)
 
     snapshot = await service(db_session).build_snapshot(project.id)
 
@@ -519,7 +476,6 @@ async def test_snapshot_property_domain_class_uris_fallback_to_scalar(
     )
     db_session.add(prop)
     await db_session.flush()
-    await db_session.refresh(prop)
 
     snapshot = await service(db_session).build_snapshot(project.id)
 
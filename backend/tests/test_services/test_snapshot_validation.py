@@ -1,7 +1,9 @@
 """Tests for snapshot validation via Pydantic validators."""
 
+from collections import defaultdict
+from collections.abc import Callable
 from types import SimpleNamespace
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
@@ -14,8 +16,11 @@ from taxonomy_builder.schemas.snapshot import (
     SnapshotRestriction,
     SnapshotScheme,
     SnapshotVocabulary,
+    ValidationError,
+    ValidationResult,
 )
 from taxonomy_builder.services.snapshot_service import validate_snapshot
+from tests.helpers import uid
 
 # ---------------------------------------------------------------------------
 # Lightweight stubs for ORM objects so we can test from_* factory methods
@@ -25,7 +30,7 @@ from taxonomy_builder.services.snapshot_service import validate_snapshot
 def _stub_concept(**overrides):
     """Stub mimicking a Concept ORM instance for from_concept()."""
     defaults = dict(
-        id=uuid4(),
+        id=uid(),
         identifier="term",
         uri="http://example.org/term",
         pref_label="Term",
@@ -42,7 +47,7 @@ def _stub_concept(**overrides):
 def _stub_property(**overrides):
     """Stub mimicking a Property ORM instance for from_property()."""
     defaults = dict(
-        id=uuid4(),
+        id=uid(),
         identifier="prop1",
         uri="http://example.org/prop1",
         label="Test Prop",
@@ -62,7 +67,7 @@ def _stub_property(**overrides):
 def _stub_ontology_class(**overrides):
     """Stub mimicking an OntologyClass ORM instance for from_class()."""
     defaults = dict(
-        id=uuid4(),
+        id=uid(),
         identifier="finding",
         uri="http://example.org/Finding",
         label="Finding",
@@ -75,8 +80,43 @@ def _stub_ontology_class(**overrides):
     return SimpleNamespace(**(defaults | overrides))
 
 
+# Tests treat the project as opaque, so every vocab shares one trusted instance.
+_PROJECT_META = SnapshotProjectMetadata.model_construct(
+    id=uid(),
+    name="Test",
+    namespace="http://example.org/",
+)
+
+
 def _project_meta() -> SnapshotProjectMetadata:
-    return SnapshotProjectMetadata(id=uuid4(), name="Test", namespace="http://example.org/")
+    return _PROJECT_META
+
+
+# Prototypes built once at import; helpers copy them with per-call updates,
+# passing fresh lists so no two snapshots share one. _EMPTY_VOCAB owns its
+# lists and doubles as the empty-project input.
+_EMPTY_VOCAB = SnapshotVocabulary.model_construct(
+    project=_project_meta(), concept_schemes=[], properties=[], classes=[]
+)
+_BASE_SCHEME = SnapshotScheme.model_construct(
+    id=UUID(int=0), title="Scheme", uri="http://example.org/scheme", concepts=[]
+)
+_BASE_CONCEPT = SnapshotConcept.model_construct(
+    id=UUID(int=0),
+    identifier="term",
+    pref_label="Term",
+    uri="http://example.org/concept/term",
+    broader_ids=[],
+    related_ids=[],
+)
+_PROP_PROTO = SnapshotProperty.model_construct(
+    id=UUID(int=0),
+    identifier="prop1",
+    uri="http://example.org/prop1",
+    label="Test Property",
+    cardinality="one",
+    required=False,
+)
 
 
 def _vocab(
@@ -84,11 +124,12 @@ def _vocab(
     properties: list[SnapshotProperty] | None = None,
     classes: list[SnapshotClass] | None = None,
 ) -> SnapshotVocabulary:
-    return SnapshotVocabulary.model_construct(
-        project=_project_meta(),
-        concept_schemes=list(schemes),
-        properties=properties or [],
-        classes=classes or [],
+    return _EMPTY_VOCAB.model_copy(
+        update={
+            "concept_schemes": list(schemes),
+            "properties": properties if properties is not None else [],
+            "classes": classes if classes is not None else [],
+        }
     )
 
 
@@ -99,11 +140,13 @@ def _scheme(
     uri: str | None = "http://example.org/scheme",
     concepts: list[SnapshotConcept] | None = None,
 ) -> SnapshotScheme:
-    return SnapshotScheme.model_construct(
-        id=id or uuid4(),
-        title=title,
-        uri=uri,
-        concepts=concepts or [],
+    return _BASE_SCHEME.model_copy(
+        update={
+            "id": id or uid(),
+            "title": title,
+            "uri": uri,
+            "concepts": concepts if concepts is not None else [],
+        }
     )
 
 
@@ -116,16 +159,26 @@ def _concept(
     broader_ids: list[UUID] | None = None,
     related_ids: list[UUID] | None = None,
 ) -> SnapshotConcept:
-    return SnapshotConcept.model_construct(
-        id=id or uuid4(),
-        identifier=identifier,
-        pref_label=pref_label,
-        uri=uri,
-        broader_ids=broader_ids or [],
-        related_ids=related_ids or [],
+    return _BASE_CONCEPT.model_copy(
+        update={
+            "id": id or uid(),
+            "identifier": identifier,
+            "pref_label": pref_label,
+            "uri": uri,
+            "broader_ids": broader_ids if broader_ids is not None else [],
+            "related_ids": related_ids if related_ids is not None else [],
+        }
     )
 
 
+def _by_code(result: ValidationResult) -> dict[str, list[ValidationError]]:
+    """Group a validation result's errors by code."""
+    grouped: dict[str, list[ValidationError]] = defaultdict(list)
+    for error in result.errors:
+        grouped[error.code].append(error)
+    return grouped
+
+
 class TestValidProject:
     def test_valid_project(self) -> None:
         concept = _concept("Term A", identifier="term-a")
@@ -136,25 +189,17 @@ class TestValidProject:
 
 
 class TestEmptyProject:
-    def test_completely_empty_project(self) -> None:
-        """A project with no schemes, classes, or properties is invalid."""
-        result = validate_snapshot(_vocab())
-        assert result.valid is False
-        assert any(e.code == "empty_project" for e in result.errors)
-
     def test_ontology_only_project_is_valid(self) -> None:
         """A project with classes and properties but no schemes is valid."""
         cls = _class("Finding", uri="http://example.org/Finding")
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Finding"],
-            property_type="object",
-            range_datatype="xsd:string",
-            cardinality="single",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Finding"],
+                "property_type": "object",
+                "range_datatype": "xsd:string",
+                "cardinality": "single",
+            }
         )
         result = validate_snapshot(_vocab(properties=[prop], classes=[cls]))
         assert result.valid is True
@@ -167,49 +212,64 @@ class TestEmptyProject:
 
     def test_properties_only_still_invalid(self) -> None:
         """Properties without any classes or schemes is still invalid (no domain to resolve)."""
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Orphan Property",
-            domain_class_uris=[],
-            property_type="rdf",
-            cardinality="single",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "label": "Orphan Property",
+                "domain_class_uris": [],
+                "property_type": "rdf",
+                "cardinality": "single",
+            }
         )
         result = validate_snapshot(_vocab(properties=[prop]))
         assert result.valid is False
-        assert any(e.code == "empty_project" for e in result.errors)
-
-
-class TestNoConceptsInScheme:
-    def test_scheme_with_no_concepts(self) -> None:
-        scheme = _scheme("Empty Scheme", concepts=[])
-        result = validate_snapshot(_vocab(scheme))
+        assert "empty_project" in _by_code(result)
+
+
+class TestSingleErrorCode:
+    """Vocabularies with exactly one defect report that defect's code."""
+
+    @pytest.mark.parametrize(
+        ("build_vocab", "expected_code"),
+        [
+            pytest.param(lambda: _EMPTY_VOCAB, "empty_project", id="empty_project"),
+            pytest.param(
+                lambda: _vocab(_scheme("Empty Scheme", concepts=[])),
+                "scheme_no_concepts",
+                id="scheme_no_concepts",
+            ),
+            pytest.param(
+                lambda: _vocab(_scheme(concepts=[_concept("   ")])),
+                "concept_missing_pref_label",
+                id="concept_whitespace_pref_label",
+            ),
+            pytest.param(
+                lambda: _vocab(_scheme(concepts=[_concept()]), classes=[_class("   ")]),
+                "class_missing_label",
+                id="class_whitespace_label",
+            ),
+        ],
+    )
+    def test_reports_code(
+        self, build_vocab: Callable[[], SnapshotVocabulary], expected_code: str
+    ) -> None:
+        result = validate_snapshot(build_vocab())
         assert result.valid is False
-        assert any(e.code == "scheme_no_concepts" for e in result.errors)
+        assert expected_code in _by_code(result)
 
 
 class TestSchemeMissingUri:
     def test_scheme_missing_uri(self) -> None:
-        scheme_id = uuid4()
+        scheme_id = uid()
         scheme = _scheme("No URI", id=scheme_id, uri=None, concepts=[_concept()])
         result = validate_snapshot(_vocab(scheme))
         assert result.valid is False
-        uri_errors = [e for e in result.errors if e.code == "scheme_missing_uri"]
+        uri_errors = _by_code(result).get("scheme_missing_uri", [])
         assert len(uri_errors) == 1
         assert uri_errors[0].entity_id == scheme_id
         assert uri_errors[0].entity_label == "No URI"
 
 
-class TestConceptMissingPrefLabel:
-    def test_whitespace_only_label(self) -> None:
-        scheme = _scheme(concepts=[_concept("   ")])
-        result = validate_snapshot(_vocab(scheme))
-        assert result.valid is False
-        assert any(e.code == "concept_missing_pref_label" for e in result.errors)
-
-
 class TestCollectsAllErrors:
     def test_multiple_errors_collected(self) -> None:
         """Validation returns all errors, not just the first one."""
@@ -224,26 +284,26 @@ class TestCollectsAllErrors:
 class TestMixedValidity:
     def test_one_valid_one_invalid_scheme(self) -> None:
         good = _scheme("Good", concepts=[_concept("Valid", identifier="valid")])
-        bad_id = uuid4()
+        bad_id = uid()
         bad = _scheme(
             "Bad", id=bad_id, uri=None,
             concepts=[_concept("Also Valid", identifier="also-valid")],
         )
         result = validate_snapshot(_vocab(good, bad))
         assert result.valid is False
-        uri_errors = [e for e in result.errors if e.code == "scheme_missing_uri"]
+        uri_errors = _by_code(result).get("scheme_missing_uri", [])
         assert len(uri_errors) == 1
         assert uri_errors[0].entity_id == bad_id
 
 
 class TestBrokenBroaderRef:
     def test_broader_referencing_nonexistent_concept(self) -> None:
-        orphan_id = uuid4()
+        orphan_id = uid()
         concept_a = _concept("A", identifier="a", broader_ids=[orphan_id])
         scheme = _scheme(concepts=[concept_a])
         result = validate_snapshot(_vocab(scheme))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "broken_broader_ref"]
+        errors = _by_code(result).get("broken_broader_ref", [])
         assert len(errors) == 1
         assert errors[0].entity_id == concept_a.id
 
@@ -257,16 +317,24 @@ class TestBrokenBroaderRef:
 
 class TestBrokenRelatedRef:
     def test_related_referencing_nonexistent_concept(self) -> None:
-        orphan_id = uuid4()
+        orphan_id = uid()
         concept_a = _concept("A", identifier="a", related_ids=[orphan_id])
         scheme = _scheme(concepts=[concept_a])
         result = validate_snapshot(_vocab(scheme))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "broken_related_ref"]
+        errors = _by_code(result).get("broken_related_ref", [])
         assert len(errors) == 1
         assert errors[0].entity_id == concept_a.id
 
 
+_BASE_CLASS = SnapshotClass.model_construct(
+    id=UUID(int=0),
+    identifier="myclass",
+    uri="http://example.org/class/myclass",
+    label="MyClass",
+)
+
+
 def _class(
     label: str = "MyClass",
     *,
@@ -274,103 +342,79 @@ def _class(
     identifier: str = "myclass",
     uri: str | None = "http://example.org/class/myclass",
 ) -> SnapshotClass:
-    return SnapshotClass.model_construct(
-        id=id or uuid4(),
-        identifier=identifier,
-        uri=uri,
-        label=label,
+    return _BASE_CLASS.model_copy(
+        update={"id": id or uid(), "identifier": identifier, "uri": uri, "label": label}
     )
 
 
 class TestPropertyMissingRangeSchemeUri:
     def test_range_scheme_id_without_uri(self) -> None:
         cls = _class("Class", uri="http://example.org/Class")
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Class"],
-            range_scheme_id=uuid4(),
-            range_scheme_uri=None,
-            cardinality="one",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Class"],
+                "range_scheme_id": uid(),
+                "range_scheme_uri": None,
+            }
         )
         scheme = _scheme(concepts=[_concept("Term")])
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls]))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "property_missing_range_scheme_uri"]
+        errors = _by_code(result).get("property_missing_range_scheme_uri", [])
         assert len(errors) == 1
         assert errors[0].entity_id == prop.id
 
 
 class TestBrokenRangeSchemeRef:
     def test_property_referencing_nonexistent_scheme(self) -> None:
-        orphan_scheme_id = uuid4()
+        orphan_scheme_id = uid()
         cls = _class("Class", uri="http://example.org/Class")
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Class"],
-            range_scheme_id=orphan_scheme_id,
-            range_scheme_uri="http://example.org/orphan",
-            cardinality="one",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Class"],
+                "range_scheme_id": orphan_scheme_id,
+                "range_scheme_uri": "http://example.org/orphan",
+            }
         )
         concept = _concept("Term")
         scheme = _scheme(concepts=[concept])
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls]))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "broken_range_scheme_ref"]
+        errors = _by_code(result).get("broken_range_scheme_ref", [])
         assert len(errors) == 1
         assert errors[0].entity_id == prop.id
 
     def test_valid_range_scheme_ref_passes(self) -> None:
         cls = _class("Class", uri="http://example.org/Class")
         scheme = _scheme(concepts=[_concept("Term")])
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Class"],
-            range_scheme_id=scheme.id,
-            range_scheme_uri="http://example.org/scheme",
-            cardinality="one",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Class"],
+                "range_scheme_id": scheme.id,
+                "range_scheme_uri": "http://example.org/scheme",
+            }
         )
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls]))
         assert result.valid is True
 
     def test_null_range_scheme_passes(self) -> None:
         cls = _class("Class", uri="http://example.org/Class")
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Class"],
-            range_scheme_id=None,
-            range_datatype="xsd:string",
-            cardinality="one",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Class"],
+                "range_scheme_id": None,
+                "range_datatype": "xsd:string",
+            }
         )
         scheme = _scheme(concepts=[_concept("Term")])
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls]))
         assert result.valid is True
 
 
-class TestClassMissingLabel:
-    def test_whitespace_only_label(self) -> None:
-        cls = _class("   ")
-        scheme = _scheme(concepts=[_concept()])
-        result = validate_snapshot(_vocab(scheme, classes=[cls]))
-        assert result.valid is False
-        assert any(e.code == "class_missing_label" for e in result.errors)
-
-
 class TestSnapshotClassSuperclassUris:
     """SnapshotClass should carry superclass_uris field."""
 
@@ -397,7 +441,7 @@ class TestSnapshotClassSuperclassUris:
         scheme = _scheme(concepts=[_concept("Term")])
         result = validate_snapshot(_vocab(scheme, classes=[cls]))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "broken_superclass_ref"]
+        errors = _by_code(result).get("broken_superclass_ref", [])
         assert len(errors) == 1
 
     def test_well_known_superclass_uri_allowed(self) -> None:
@@ -445,67 +489,32 @@ class TestSnapshotPropertyNewFields:
         prop = SnapshotProperty.from_property(stub)
         assert prop.domain_class_uris == []
 
-    def test_property_type_from_column_datatype(self) -> None:
-        """property_type='datatype' passes through from column."""
-        stub = _stub_property(property_type="datatype", range_datatype="xsd:string")
-        prop = SnapshotProperty.from_property(stub)
-        assert prop.property_type == "datatype"
-
-    def test_property_type_from_column_object(self) -> None:
-        """property_type='object' passes through from column."""
-        stub = _stub_property(property_type="object", range_class="http://example.org/Class")
-        prop = SnapshotProperty.from_property(stub)
-        assert prop.property_type == "object"
-
-
-def _fake_property(**overrides):
-    """Create a fake Property-like object for testing from_property()."""
-    from types import SimpleNamespace
-
-    defaults = {
-        "id": uuid4(),
-        "identifier": "prop1",
-        "uri": "http://example.org/prop1",
-        "label": "Test Property",
-        "description": None,
-        "domain_classes": [],
-        "property_type": "object",
-        "range_scheme_id": None,
-        "range_scheme": None,
-        "range_class": None,
-        "range_datatype": None,
-        "cardinality": "single",
-        "required": False,
-    }
-    defaults.update(overrides)
-    return SimpleNamespace(**defaults)
-
 
 class TestFromPropertyTypeColumn:
     """from_property() reads property_type from the column."""
 
     def test_datatype_property(self) -> None:
         """property_type='datatype' passes through from column."""
-        prop = _fake_property(property_type="datatype", range_datatype="xsd:string")
+        prop = _stub_property(property_type="datatype", range_datatype="xsd:string")
         snap = SnapshotProperty.from_property(prop)
         assert snap.property_type == "datatype"
 
     def test_object_property_with_range_class(self) -> None:
         """property_type='object' passes through from column."""
-        prop = _fake_property(property_type="object", range_class="http://example.org/Target")
+        prop = _stub_property(property_type="object", range_class="http://example.org/Target")
         snap = SnapshotProperty.from_property(prop)
         assert snap.property_type == "object"
 
     def test_object_property_with_range_scheme(self) -> None:
         """property_type='object' passes through from column."""
-        scheme = _fake_property(uri="http://example.org/scheme")
-        prop = _fake_property(property_type="object", range_scheme_id=uuid4(), range_scheme=scheme)
+        scheme = _stub_property(uri="http://example.org/scheme")
+        prop = _stub_property(property_type="object", range_scheme_id=uid(), range_scheme=scheme)
         snap = SnapshotProperty.from_property(prop)
         assert snap.property_type == "object"
 
     def test_rdf_property_no_range(self) -> None:
         """property_type='rdf' passes through from column."""
-        prop = _fake_property(property_type="rdf")
+        prop = _stub_property(property_type="rdf")
         snap = SnapshotProperty.from_property(prop)
         assert snap.property_type == "rdf"
 
@@ -516,7 +525,7 @@ class TestRequireValidRange:
     def test_rdf_type_allows_zero_ranges(self) -> None:
         """rdf:Property with no range should pass validation."""
         prop = SnapshotProperty(
-            id=uuid4(),
+            id=uid(),
             identifier="codedValue",
             uri="http://example.org/codedValue",
             label="Coded Value",
@@ -533,7 +542,7 @@ class TestRequireValidRange:
     def test_rdf_type_allows_one_range(self) -> None:
         """rdf:Property with one range should pass validation."""
         prop = SnapshotProperty(
-            id=uuid4(),
+            id=uid(),
             identifier="codedValue",
             uri="http://example.org/codedValue",
             label="Coded Value",
@@ -549,7 +558,7 @@ class TestRequireValidRange:
         """object property with no range should fail."""
         with pytest.raises(PydanticValidationError):
             SnapshotProperty(
-                id=uuid4(),
+                id=uid(),
                 identifier="prop1",
                 uri="http://example.org/prop1",
                 label="Test Prop",
@@ -566,7 +575,7 @@ class TestRequireValidRange:
         """datatype property with no range should fail."""
         with pytest.raises(PydanticValidationError):
             SnapshotProperty(
-                id=uuid4(),
+                id=uid(),
                 identifier="prop1",
                 uri="http://example.org/prop1",
                 label="Test Prop",
@@ -583,13 +592,13 @@ class TestRequireValidRange:
         """object property with more than one range should fail."""
         with pytest.raises(PydanticValidationError):
             SnapshotProperty(
-                id=uuid4(),
+                id=uid(),
                 identifier="prop1",
                 uri="http://example.org/prop1",
                 label="Test Prop",
                 domain_class_uris=["http://example.org/Class"],
                 property_type="object",
-                range_scheme_id=uuid4(),
+                range_scheme_id=uid(),
                 range_scheme_uri="http://example.org/scheme",
                 range_datatype="xsd:string",
                 range_class=None,
@@ -601,7 +610,7 @@ class TestRequireValidRange:
         """rdf:Property with more than one range should fail."""
         with pytest.raises(PydanticValidationError):
             SnapshotProperty(
-                id=uuid4(),
+                id=uid(),
                 identifier="codedValue",
                 uri="http://example.org/codedValue",
                 label="Coded Value",
@@ -619,38 +628,34 @@ class TestDomainClassUrisValidation:
 
     def test_all_domain_uris_must_resolve(self) -> None:
         """Each URI in domain_class_uris must exist in project classes."""
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Class", "http://example.org/NonExistent"],
-            property_type="object",
-            range_datatype="xsd:string",
-            cardinality="single",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Class", "http://example.org/NonExistent"],
+                "property_type": "object",
+                "range_datatype": "xsd:string",
+                "cardinality": "single",
+            }
         )
         cls = _class("Class", uri="http://example.org/Class")
         scheme = _scheme(concepts=[_concept("Term")])
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls]))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "broken_domain_class_ref"]
+        errors = _by_code(result).get("broken_domain_class_ref", [])
         assert len(errors) == 1
 
     def test_all_domain_uris_valid(self) -> None:
         """All URIs resolving should pass."""
         cls_a = _class("A", uri="http://example.org/A", identifier="a")
         cls_b = _class("B", uri="http://example.org/B", identifier="b")
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/A", "http://example.org/B"],
-            property_type="object",
-            range_datatype="xsd:string",
-            cardinality="single",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/A", "http://example.org/B"],
+                "property_type": "object",
+                "range_datatype": "xsd:string",
+                "cardinality": "single",
+            }
         )
         scheme = _scheme(concepts=[_concept("Term")])
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls_a, cls_b]))
@@ -659,36 +664,30 @@ class TestDomainClassUrisValidation:
 
 class TestBrokenDomainClassRef:
     def test_property_domain_class_not_in_classes(self) -> None:
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/NonExistent"],
-            range_datatype="xsd:string",
-            cardinality="one",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/NonExistent"],
+                "range_datatype": "xsd:string",
+            }
         )
         cls = _class("MyClass", uri="http://example.org/class/myclass")
         concept = _concept("Term")
         scheme = _scheme(concepts=[concept])
         result = validate_snapshot(_vocab(scheme, properties=[prop], classes=[cls]))
         assert result.valid is False
-        errors = [e for e in result.errors if e.code == "broken_domain_class_ref"]
+        errors = _by_code(result).get("broken_domain_class_ref", [])
         assert len(errors) == 1
         assert errors[0].entity_id == prop.id
 
     def test_valid_domain_class_ref_passes(self) -> None:
         cls = _class("MyClass", uri="http://example.org/Class")
-        prop = SnapshotProperty.model_construct(
-            id=uuid4(),
-            identifier="prop1",
-            uri="http://example.org/prop1",
-            label="Test Property",
-            domain_class_uris=["http://example.org/Class"],
-            range_datatype="xsd:string",
-            cardinality="one",
-            required=False,
+        prop = _PROP_PROTO.model_copy(
+            update={
+                "id": uid(),
+                "domain_class_uris": ["http://example.org/Class"],
+                "range_datatype": "xsd:string",
+            }
         )
         concept = _concept("Term")
         scheme = _scheme(concepts=[concept])
@@ -701,7 +700,7 @@ class TestSnapshotClassRestrictions:
 
     def test_restrictions_field_on_construct(self) -> None:
         cls = SnapshotClass.model_construct(
-            id=uuid4(),
+            id=uid(),
             identifier="StringAnnotation",
             uri="http://example.org/StringAnnotation",
             label="String Annotation",
@@ -1,15 +1,37 @@
 """Tests for full ontology Turtle import (OWL classes + properties)."""
 
+import functools
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import NamedTuple
+from uuid import UUID
+
 import pytest
+from rdflib import Graph
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from taxonomy_builder.database import db_manager
 from taxonomy_builder.models.concept_scheme import ConceptScheme
 from taxonomy_builder.models.ontology_class import OntologyClass
 from taxonomy_builder.models.project import Project
 from taxonomy_builder.models.property import Property
+from taxonomy_builder.schemas.skos_import import ImportResultResponse
+from taxonomy_builder.services.project_service import ProjectService
+from taxonomy_builder.services.rdf_parser import parse_rdf
 from taxonomy_builder.services.skos_import_service import SKOSImportService
 
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "ttl"
+
+
+@functools.cache
+def _graph(name: str) -> Graph:
+    """Parsed graph for a Turtle file under tests/fixtures/ttl, parsed once.
+
+    The importer only reads the graph, so tests can share one instance.
+    """
+    return parse_rdf((FIXTURES_DIR / name).read_bytes(), "turtle")
+
 
 @pytest.fixture
 async def project(db_session: AsyncSession) -> Project:
@@ -25,110 +47,54 @@ async def project(db_session: AsyncSession) -> Project:
     return project
 
 
-# --- Test data ---
+class FullImport(NamedTuple):
+    """Result and stored rows of a single full-ontology.ttl import."""
 
-# Full ontology: classes, concept-subclasses, schemes, concepts, properties
-FULL_ONTOLOGY_TTL = b"""
-@prefix owl: <http://www.w3.org/2002/07/owl#> .
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-@prefix ex: <http://example.org/> .
+    result: ImportResultResponse
+    classes: dict[str, OntologyClass]
+    properties: dict[str, Property]
+    schemes: dict[UUID, ConceptScheme]
 
-# Domain classes (should become OntologyClass)
-ex:Finding a owl:Class ;
-    rdfs:label "Finding" ;
-    rdfs:comment "A research finding" .
-
-ex:Outcome a owl:Class ;
-    rdfs:label "Outcome" ;
-    skos:scopeNote "Used in evidence synthesis" .
-
-# Concept-typed class (included as OntologyClass since #144)
-ex:EducationLevel a owl:Class ;
-    rdfs:subClassOf skos:Concept ;
-    rdfs:label "Education Level" .
-
-# Concept schemes
-ex:EducationLevelScheme a skos:ConceptScheme ;
-    rdfs:label "Education Levels" .
-
-ex:OutcomeTypeScheme a skos:ConceptScheme ;
-    rdfs:label "Outcome Types" .
-
-# Concepts (typed via subclass)
-ex:Primary a ex:EducationLevel ;
-    skos:inScheme ex:EducationLevelScheme ;
-    skos:prefLabel "Primary Education" .
-
-ex:Secondary a ex:EducationLevel ;
-    skos:inScheme ex:EducationLevelScheme ;
-    skos:prefLabel "Secondary Education" ;
-    skos:broader ex:Primary .
-
-ex:Academic a skos:Concept ;
-    skos:inScheme ex:OutcomeTypeScheme ;
-    skos:prefLabel "Academic" .
-
-# Object property - range resolves to scheme via RDF linkage
-ex:educationLevel a owl:ObjectProperty ;
-    rdfs:label "Education Level" ;
-    rdfs:comment "The education level of a finding" ;
-    rdfs:domain ex:Finding ;
-    rdfs:range ex:EducationLevel .
-
-# Object property - range IS a scheme URI (direct match)
-ex:outcomeType a owl:ObjectProperty ;
-    rdfs:label "Outcome Type" ;
-    rdfs:domain ex:Outcome ;
-    rdfs:range ex:OutcomeTypeScheme .
-
-# Object property - range resolves to OntologyClass
-ex:hasFinding a owl:ObjectProperty ;
-    rdfs:label "has finding" ;
-    rdfs:domain ex:Outcome ;
-    rdfs:range ex:Finding .
-
-# Datatype property
-ex:sampleSize a owl:DatatypeProperty ;
-    rdfs:label "Sample Size" ;
-    rdfs:comment "Number of participants" ;
-    rdfs:domain ex:Finding ;
-    rdfs:range xsd:integer .
-"""
 
-# Property whose range doesn't exist in the project
-NO_RANGE_MATCH_TTL = b"""
-@prefix owl: <http://www.w3.org/2002/07/owl#> .
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix ex: <http://example.org/> .
-
-ex:Finding a owl:Class ;
-    rdfs:label "Finding" .
+@pytest.fixture(scope="class")
+async def full_import() -> AsyncGenerator[FullImport]:
+    """Import full-ontology.ttl once per test class, rolled back afterwards.
 
-ex:mysteryCoding a owl:ObjectProperty ;
-    rdfs:label "Mystery Coding" ;
-    rdfs:domain ex:Finding ;
-    rdfs:range ex:UnknownClass .
-"""
-
-# Datatype properties only (no classes, no schemes)
-DATATYPE_ONLY_TTL = b"""
-@prefix owl: <http://www.w3.org/2002/07/owl#> .
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-@prefix ex: <http://example.org/> .
+    Uses its own connection and transaction (mirroring ``db_session``) so the
+    parse, inserts, and the reads of the stored rows are shared by every
+    read-only test in the class. The reads run one after another: an
+    AsyncSession does not allow concurrent statements.
+    """
+    async with db_manager.engine.connect() as conn:
+        trans = await conn.begin()
+        async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+            project = Project(
+                name="Turtle Import Test Project",
+                namespace="http://example.org",
+                identifier_prefix="TST",
+            )
+            session.add(project)
+            await session.flush()
 
-ex:title a owl:DatatypeProperty ;
-    rdfs:label "Title" ;
-    rdfs:domain ex:Finding ;
-    rdfs:range xsd:string .
+            service = SKOSImportService(session, project_service=ProjectService(session))
+            result = await service.execute_graph(project.id, _graph("full-ontology.ttl"))
 
-ex:count a owl:DatatypeProperty ;
-    rdfs:label "Count" ;
-    rdfs:domain ex:Finding ;
-    rdfs:range xsd:integer .
-"""
+            classes = await session.scalars(
+                select(OntologyClass).where(OntologyClass.project_id == project.id)
+            )
+            properties = await session.scalars(
+                select(Property).where(Property.project_id == project.id)
+            )
+            schemes = await session.scalars(
+                select(ConceptScheme).where(ConceptScheme.project_id == project.id)
+            )
+            yield FullImport(
+                result,
+                classes={c.identifier: c for c in classes},
+                properties={p.identifier: p for p in properties},
+                schemes={s.id: s for s in schemes},
+            )
+        await trans.rollback()
 
 
 class TestPreview:
@@ -139,7 +105,7 @@ class TestPreview:
         self, import_service: SKOSImportService, project: Project
     ) -> None:
         """Preview shows correct counts for classes, schemes, concepts, properties."""
-        result = await import_service.preview(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
+        result = await import_service.preview_graph(project.id, _graph("full-ontology.ttl"))
 
         assert result.valid is True
         assert result.classes_count == 3  # Finding, Outcome, EducationLevel
@@ -154,7 +120,7 @@ class TestPreview:
         # Property detail
         edu = next(p for p in result.properties if p.identifier == "educationLevel")
         assert edu.property_type == "object"
-        assert edu.domain_class_uris == ["http://example.org/Finding"]
+        assert edu.domain_class_uris == ["https://example.org/Finding"]
 
         sample = next(p for p in result.properties if p.identifier == "sampleSize")
         assert sample.property_type == "datatype"
@@ -165,22 +131,24 @@ class TestPreview:
         self, import_service: SKOSImportService, project: Project
     ) -> None:
         """File with only datatype properties, no classes or schemes."""
-        result = await import_service.preview(project.id, DATATYPE_ONLY_TTL, "test.ttl")
+        result = await import_service.preview_graph(project.id, _graph("datatype-only.ttl"))
 
         assert result.classes_count == 0
         assert result.properties_count == 2
         assert all(p.property_type == "datatype" for p in result.properties)
 
 
-class TestExecute:
-    """Import execution tests."""
+class TestExecuteFullOntology:
+    """Read-only checks against a single import of full-ontology.ttl.
+
+    The import runs once for the class (see ``full_import``); tests here must
+    not write to the database.
+    """
 
     @pytest.mark.asyncio
-    async def test_full_ontology_creates_all_entities(
-        self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
-    ) -> None:
+    async def test_full_ontology_creates_all_entities(self, full_import: FullImport) -> None:
         """Import creates classes, schemes, concepts, and properties."""
-        result = await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
+        result = full_import.result
 
         assert len(result.classes_created) == 3
         assert len(result.schemes_created) == 2
@@ -188,51 +156,60 @@ class TestExecute:
         assert len(result.properties_created) == 4
 
     @pytest.mark.asyncio
-    async def test_concept_typed_classes_included(
-        self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
-    ) -> None:
+    async def test_concept_typed_classes_included(self, full_import: FullImport) -> None:
         """Concept-typed classes are included as OntologyClass records (#144)."""
-        await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
-
-        classes = (
-            await db_session.execute(
-                select(OntologyClass).where(OntologyClass.project_id == project.id)
-            )
-        ).scalars().all()
-        assert {c.identifier for c in classes} == {"Finding", "Outcome", "EducationLevel"}
+        assert full_import.classes.keys() == {"Finding", "Outcome", "EducationLevel"}
 
     @pytest.mark.asyncio
-    async def test_class_metadata_stored(
-        self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
-    ) -> None:
+    async def test_class_metadata_stored(self, full_import: FullImport) -> None:
         """OntologyClass records have correct label, description, scope_note."""
-        await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
-
-        classes = (
-            await db_session.execute(
-                select(OntologyClass).where(OntologyClass.project_id == project.id)
-            )
-        ).scalars().all()
-
-        finding = next(c for c in classes if c.identifier == "Finding")
+        finding = full_import.classes["Finding"]
         assert finding.label == "Finding"
         assert finding.description == "A research finding"
 
-        outcome = next(c for c in classes if c.identifier == "Outcome")
+        outcome = full_import.classes["Outcome"]
         assert outcome.scope_note == "Used in evidence synthesis"
 
+    @pytest.mark.asyncio
+    async def test_range_resolved_to_scheme_via_rdf_linkage(self, full_import: FullImport) -> None:
+        """Object property range resolves to scheme when typed concepts exist."""
+        edu_prop = full_import.properties["educationLevel"]
+        assert edu_prop.range_scheme_id is not None
+        scheme = full_import.schemes[edu_prop.range_scheme_id]
+        assert scheme.title == "Education Levels"
+
+    @pytest.mark.asyncio
+    async def test_range_resolved_to_scheme_by_direct_match(self, full_import: FullImport) -> None:
+        """Object property range resolves when the URI IS a scheme URI."""
+        prop = full_import.properties["outcomeType"]
+        assert prop.range_scheme_id is not None
+        scheme = full_import.schemes[prop.range_scheme_id]
+        assert scheme.title == "Outcome Types"
+
+    @pytest.mark.asyncio
+    async def test_range_resolved_to_ontology_class(self, full_import: FullImport) -> None:
+        """Object property range resolves to OntologyClass in same project."""
+        prop = full_import.properties["hasFinding"]
+        assert prop.range_class is not None
+        assert prop.range_class == "https://example.org/Finding"
+        assert prop.range_scheme_id is None
+
+
+class TestExecute:
+    """Import execution tests."""
+
     @pytest.mark.asyncio
     async def test_duplicate_class_skipped(
         self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
     ) -> None:
         """Re-importing the same class identifier is silently skipped."""
-        await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
+        await import_service.execute_graph(project.id, _graph("full-ontology.ttl"))
         # Import again - classes should not duplicate
         # (schemes will conflict, so use a class-only file)
         class_only = b"""
 @prefix owl: <http://www.w3.org/2002/07/owl#> .
 @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix ex: <http://example.org/> .
+@prefix ex: <https://example.org/> .
 
 ex:Finding a owl:Class ;
     rdfs:label "Finding" .
@@ -240,66 +217,12 @@ ex:Finding a owl:Class ;
         result = await import_service.execute(project.id, class_only, "test.ttl")
         assert len(result.classes_created) == 0
 
-    @pytest.mark.asyncio
-    async def test_range_resolved_to_scheme_via_rdf_linkage(
-        self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
-    ) -> None:
-        """Object property range resolves to scheme when typed concepts exist."""
-        await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
-
-        props = (
-            await db_session.execute(
-                select(Property).where(Property.project_id == project.id)
-            )
-        ).scalars().all()
-
-        edu_prop = next(p for p in props if p.identifier == "educationLevel")
-        assert edu_prop.range_scheme_id is not None
-        scheme = await db_session.get(ConceptScheme, edu_prop.range_scheme_id)
-        assert scheme.title == "Education Levels"
-
-    @pytest.mark.asyncio
-    async def test_range_resolved_to_scheme_by_direct_match(
-        self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
-    ) -> None:
-        """Object property range resolves when the URI IS a scheme URI."""
-        await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
-
-        props = (
-            await db_session.execute(
-                select(Property).where(Property.project_id == project.id)
-            )
-        ).scalars().all()
-
-        prop = next(p for p in props if p.identifier == "outcomeType")
-        assert prop.range_scheme_id is not None
-        scheme = await db_session.get(ConceptScheme, prop.range_scheme_id)
-        assert scheme.title == "Outcome Types"
-
-    @pytest.mark.asyncio
-    async def test_range_resolved_to_ontology_class(
-        self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
-    ) -> None:
-        """Object property range resolves to OntologyClass in same project."""
-        await import_service.execute(project.id, FULL_ONTOLOGY_TTL, "test.ttl")
-
-        props = (
-            await db_session.execute(
-                select(Property).where(Property.project_id == project.id)
-            )
-        ).scalars().all()
-
-        prop = next(p for p in props if p.identifier == "hasFinding")
-        assert prop.range_class is not None
-        assert prop.range_class == "http://example.org/Finding"
-        assert prop.range_scheme_id is None
-
     @pytest.mark.asyncio
     async def test_unresolvable_range_emits_warning(
         self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
     ) -> None:
         """Unresolvable range stores URI as range_class and emits warning."""
-        result = await import_service.execute(project.id, NO_RANGE_MATCH_TTL, "test.ttl")
+        result = await import_service.execute_graph(project.id, _graph("no-range-match.ttl"))
 
         props = (
             await db_session.execute(
@@ -309,7 +232,7 @@ ex:Finding a owl:Class ;
         prop = props[0]
         assert prop.range_scheme_id is None
         assert prop.range_datatype is None
-        assert prop.range_class == "http://example.org/UnknownClass"
+        assert prop.range_class == "https://example.org/UnknownClass"
 
         assert len(result.warnings) == 1
         assert "UnknownClass" in result.warnings[0]
@@ -319,7 +242,7 @@ ex:Finding a owl:Class ;
         self, db_session: AsyncSession, import_service: SKOSImportService, project: Project
     ) -> None:
         """XSD ranges are abbreviated to xsd: prefix."""
-        await import_service.execute(project.id, DATATYPE_ONLY_TTL, "test.ttl")
+        await import_service.execute_graph(project.id, _graph("datatype-only.ttl"))
 
         props = (
             await db_session.execute(